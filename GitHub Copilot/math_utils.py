@@ -11,19 +11,47 @@ Features:
 - Factorial with explicit integer checks
 - gcd and lcm for multiple integers
 - Primality test
+- NumPy batch helpers: is_prime_many, square_many, clamp_array (require NumPy)
 - Basic descriptive statistics (mean, median, mode, variance, stddev)
 - Utility helpers: clamp, approx_equal
 
 Requires Python 3.8+ for statistics.multimode (falls back to custom implementation when necessary).
+Setting MATH_UTILS_DISK_CACHE=1 (with the diskcache package installed) persists expensive factorial
+and primality results in ~/.cache/math_utils across interpreter restarts.
+NumPy is optional: the *_many batch helpers require it, and variance/stddev use it for large
+real-valued inputs (with a Numba Welford kernel for very long data when Numba is installed).
 """
 
 from __future__ import annotations
 
 import math
+import os
 import statistics
+from collections import Counter
+from functools import lru_cache
 from numbers import Number
 from typing import Iterable, List, Union, Sequence
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the batch helpers need it
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; used only for very long variance inputs
+    njit = None
+
+# Opt-in persistent memoization: MATH_UTILS_DISK_CACHE=1 and the diskcache package
+_disk_cache = None
+if os.environ.get("MATH_UTILS_DISK_CACHE") == "1":
+    try:
+        import diskcache
+    except ImportError:
+        pass
+    else:
+        _disk_cache = diskcache.Cache(os.path.expanduser("~/.cache/math_utils"))
+
 # Exceptions
 
 
@@ -42,12 +70,32 @@ class NegativeFactorialError(MathError):
 # Type aliases
 Numeric = Union[int, float, complex]
 
+# Concrete numeric types checked by exact type before falling back to the ABC.
+# Arithmetic helpers test them inline and only call the validators when they miss.
+_NUMTYPES = (int, float, complex)
+
+# Inputs at least this long are reduced with NumPy instead of the exact statistics module
+_NUMPY_MIN_SIZE = 1024
+
+# Every int of smaller magnitude is exact in float64; larger ints keep the exact statistics path
+_FLOAT64_EXACT_INT = 2**53
+
+# Only inputs above this size are worth a disk round-trip
+_DISK_CACHE_MIN_N = 2**20
+
+
+def _disk_memoize(func):
+    """Memoize func in the opt-in disk cache; returns func unchanged when it is disabled."""
+    if _disk_cache is None:
+        return func
+    return _disk_cache.memoize(name=f"math_utils.{func.__name__}")(func)
+
 
 # Helper validators
 
 
 def _ensure_number(x: object, name: str = "value") -> Number:
-    if not isinstance(x, Number):
+    if type(x) not in _NUMTYPES and not isinstance(x, Number):
         raise TypeError(f"{name} must be a number (int, float, complex); got {type(x).__name__}")
     return x
 
@@ -60,32 +108,75 @@ def _ensure_iterable_numbers(data: Iterable, name: str = "data") -> List[Number]
     if not seq:
         raise ValueError(f"{name} must not be empty")
     for i, v in enumerate(seq):
-        if not isinstance(v, Number):
+        if type(v) not in _NUMTYPES and not isinstance(v, Number):
             raise TypeError(f"element {i} of {name} is not a number (got {type(v).__name__})")
     return seq
 
 
+def _ensure_iterable_numbers_np(data: Iterable, name: str = "data") -> Union["np.ndarray", List[Number]]:
+    """
+    Validate data like _ensure_iterable_numbers, returning a 1-D int/float ndarray when possible.
+
+    Numeric NumPy arrays are used without copying them into a list, and long iterables are
+    validated by NumPy's inferred dtype instead of a per-element isinstance loop. Short
+    inputs, data holding other numbers (Fraction, Decimal, complex), ints mixed with floats,
+    and ints of magnitude 2**53 or more come back as a validated list so callers can keep the
+    exact statistics implementation.
+    """
+    if np is not None and isinstance(data, np.ndarray) and data.ndim == 1 and data.dtype.kind in "iuf":
+        if data.size == 0:
+            raise ValueError(f"{name} must not be empty")
+        return data if _exact_in_float64(data) else data.tolist()
+    if np is None:
+        return _ensure_iterable_numbers(data, name)
+    try:
+        seq = list(data)
+    except TypeError:
+        raise TypeError(f"{name} must be an iterable of numbers")
+    if len(seq) >= _NUMPY_MIN_SIZE:
+        try:
+            arr = np.asarray(seq)
+        except ValueError:
+            arr = None
+        if arr is not None and arr.ndim == 1 and arr.dtype.kind in "iuf" and _exact_in_float64(arr):
+            # Ints mixed with floats would be rounded to float64; only all-float lists stay arrays
+            if arr.dtype.kind != "f" or all(isinstance(v, float) for v in seq):
+                return arr
+    return _ensure_iterable_numbers(seq, name)
+
+
+def _exact_in_float64(arr: "np.ndarray") -> bool:
+    """Return False for int arrays holding values that float64 reductions would round."""
+    if arr.dtype.kind not in "iu":
+        return True
+    # min/max rather than np.abs, which wraps around for the most negative int64
+    return -_FLOAT64_EXACT_INT < int(arr.min()) and int(arr.max()) < _FLOAT64_EXACT_INT
+
+
 # Arithmetic
 
 
 def add(a: Numeric, b: Numeric) -> Numeric:
     """Return a + b after validating inputs are numbers."""
-    _ensure_number(a, "a")
-    _ensure_number(b, "b")
+    if type(a) not in _NUMTYPES or type(b) not in _NUMTYPES:
+        _ensure_number(a, "a")
+        _ensure_number(b, "b")
     return a + b
 
 
 def subtract(a: Numeric, b: Numeric) -> Numeric:
     """Return a - b after validating inputs are numbers."""
-    _ensure_number(a, "a")
-    _ensure_number(b, "b")
+    if type(a) not in _NUMTYPES or type(b) not in _NUMTYPES:
+        _ensure_number(a, "a")
+        _ensure_number(b, "b")
     return a - b
 
 
 def multiply(a: Numeric, b: Numeric) -> Numeric:
     """Return a * b after validating inputs are numbers."""
-    _ensure_number(a, "a")
-    _ensure_number(b, "b")
+    if type(a) not in _NUMTYPES or type(b) not in _NUMTYPES:
+        _ensure_number(a, "a")
+        _ensure_number(b, "b")
     return a * b
 
 
@@ -101,8 +192,9 @@ def divide(a: Numeric, b: Numeric, *, raise_on_zero: bool = True) -> float:
     - ZeroDivisionError when b == 0 and raise_on_zero is True
     - TypeError when inputs are not numeric
     """
-    _ensure_number(a, "a")
-    _ensure_number(b, "b")
+    if type(a) not in _NUMTYPES or type(b) not in _NUMTYPES:
+        _ensure_number(a, "a")
+        _ensure_number(b, "b")
     if b == 0:
         if raise_on_zero:
             raise ZeroDivisionError("division by zero")
@@ -112,8 +204,9 @@ def divide(a: Numeric, b: Numeric, *, raise_on_zero: bool = True) -> float:
 
 def power(a: Numeric, b: Numeric) -> Numeric:
     """Return a ** b with basic validation. Let Python handle domain errors."""
-    _ensure_number(a, "a")
-    _ensure_number(b, "b")
+    if type(a) not in _NUMTYPES or type(b) not in _NUMTYPES:
+        _ensure_number(a, "a")
+        _ensure_number(b, "b")
     return a ** b
 
 
@@ -137,10 +230,26 @@ def sqrt(x: Numeric, *, allow_complex: bool = False) -> Numeric:
 # Integer / number-theoretic utilities
 
 
+@_disk_memoize
+def _factorial_persistent(n: int) -> int:
+    return math.factorial(n)
+
+
+@lru_cache(maxsize=1024)
+def _fact(n: int) -> int:
+    if n > _DISK_CACHE_MIN_N:
+        return _factorial_persistent(n)
+    return math.factorial(n)
+
+
 def factorial(n: int) -> int:
     """
     Return n! for non-negative integers.
 
+    Results for the 1024 most recently used inputs are cached, so repeated calls
+    with the same n are a dictionary lookup instead of a bignum product. With
+    MATH_UTILS_DISK_CACHE=1, results for n > 2**20 are also kept on disk.
+
     Raises:
     - NonIntegerError if n is not an int
     - NegativeFactorialError if n < 0
@@ -149,8 +258,8 @@ def factorial(n: int) -> int:
         raise NonIntegerError("factorial requires an integer input")
     if n < 0:
         raise NegativeFactorialError("factorial is not defined for negative integers")
-    # Use math.factorial for speed and correctness
-    return math.factorial(n)
+    # Use math.factorial for speed and correctness; _fact memoizes it
+    return _fact(n)
 
 
 def gcd(*args: int) -> int:
@@ -163,9 +272,11 @@ def gcd(*args: int) -> int:
     """
     if not args:
         raise ValueError("gcd requires at least one integer argument")
-    for x in args:
-        if not isinstance(x, int):
-            raise TypeError("gcd requires integer arguments")
+    if not all(isinstance(x, int) for x in args):
+        raise TypeError("gcd requires integer arguments")
+    if hasattr(math, "lcm"):
+        # Python 3.9+ (added alongside math.lcm): math.gcd is variadic
+        return math.gcd(*args)
     result = abs(args[0])
     for x in args[1:]:
         result = math.gcd(result, abs(x))
@@ -182,9 +293,11 @@ def lcm(*args: int) -> int:
     """
     if not args:
         raise ValueError("lcm requires at least one integer argument")
-    for x in args:
-        if not isinstance(x, int):
-            raise TypeError("lcm requires integer arguments")
+    if not all(isinstance(x, int) for x in args):
+        raise TypeError("lcm requires integer arguments")
+    if hasattr(math, "lcm"):
+        # Python 3.9+: variadic C implementation
+        return math.lcm(*args)
     def _lcm2(a: int, b: int) -> int:
         if a == 0 or b == 0:
             return 0
@@ -195,29 +308,158 @@ def lcm(*args: int) -> int:
     return result
 
 
+def _build_prime_bitset(limit: int) -> bytes:
+    """Sieve of Eratosthenes below limit (a multiple of 8), packed one bit per integer."""
+    sieve = bytearray([1]) * limit
+    sieve[0] = sieve[1] = 0
+    for i in range(2, math.isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytearray(len(range(i * i, limit, i)))
+    bits = bytearray(limit // 8)
+    for n in range(limit):
+        if sieve[n]:
+            bits[n >> 3] |= 1 << (n & 7)
+    return bytes(bits)
+
+
+# Primality of every n below _BITSET_LIMIT, answered with a single lookup
+_BITSET_LIMIT = 32768
+_SMALL_PRIME_BITSET = _build_prime_bitset(_BITSET_LIMIT)
+
+# Primes below 1000, used for trial division before Miller-Rabin
+_SMALL_PRIMES = tuple(p for p in range(1000) if (_SMALL_PRIME_BITSET[p >> 3] >> (p & 7)) & 1)
+
+# Miller-Rabin bases that make the test deterministic for n < 3.3e24
+# (2..37 alone are fooled by 318665857834031151167461 = 399165290221 * 798330580441)
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+# Only reached for n >= 997**2 (about 2**20), so every call is worth persisting
+@_disk_memoize
+def _miller_rabin(n: int) -> bool:
+    """Strong-probable-prime test of odd n > 41 against every base in _MR_BASES."""
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _is_prime_large(n: int) -> bool:
+    """Primality of n >= _BITSET_LIMIT: trial division by small primes, then Miller-Rabin."""
+    for p in _SMALL_PRIMES:
+        if p * p > n:
+            return True
+        if n % p == 0:
+            return n == p
+    return _miller_rabin(n)
+
+
 def is_prime(n: int) -> bool:
     """
     Determine whether n is a prime number.
 
     - Works for integers (negative, 0, 1 are not prime).
-    - Uses simple deterministic trial division which is efficient for small-medium integers.
+    - n < 32768 is answered from a bit table sieved once at import.
+    - Trial division by the primes below 1000 settles every n < 997**2 (and most composites).
+    - Larger candidates go through Miller-Rabin with the prime bases 2..41, which is
+      deterministic for n < 3.3e24. Above that the result is probabilistic: a True may be a
+      composite that is a strong pseudoprime to all thirteen bases.
+    - Results for n >= 32768 are memoized (4096 most recent inputs); with MATH_UTILS_DISK_CACHE=1
+      the Miller-Rabin results are also kept on disk.
     """
     if not isinstance(n, int):
         raise TypeError("is_prime requires an integer input")
     if n <= 1:
         return False
-    if n <= 3:
-        return True
-    if n % 2 == 0:
-        return False
-    # trial division up to sqrt(n)
-    limit = int(math.isqrt(n))
-    i = 3
-    while i <= limit:
-        if n % i == 0:
-            return False
-        i += 2
-    return True
+    if n < _BITSET_LIMIT:
+        return bool((_SMALL_PRIME_BITSET[n >> 3] >> (n & 7)) & 1)
+    return _is_prime_large(n)
+
+
+# NumPy batch helpers
+
+
+def _ensure_numpy(func: str) -> None:
+    if np is None:
+        raise ImportError(f"{func} requires NumPy")
+
+
+def is_prime_many(ns: "np.ndarray") -> "np.ndarray":
+    """
+    Vectorized primality test over an integer array.
+
+    Returns a boolean array of the same shape. Trial division by 2, 3 and the 6k +/- 1
+    candidates runs as whole-array NumPy operations up to sqrt(max(ns)), so it suits
+    many small-to-medium values.
+
+    Raises:
+    - ImportError if NumPy is not installed
+    - TypeError if ns does not have an integer dtype
+    """
+    _ensure_numpy("is_prime_many")
+    ns = np.asarray(ns)
+    if ns.dtype.kind not in "iu":
+        raise TypeError("is_prime_many requires an integer array")
+    out = ns > 1
+    if ns.size == 0:
+        return out
+    out &= (ns == 2) | (ns % 2 != 0)
+    out &= (ns == 3) | (ns % 3 != 0)
+    n_max = int(ns.max())
+    i = 5
+    while i * i <= n_max:
+        out &= (ns == i) | (ns % i != 0)
+        out &= (ns == i + 2) | (ns % (i + 2) != 0)
+        i += 6
+    return out
+
+
+def square_many(arr: "np.ndarray") -> "np.ndarray":
+    """
+    Return the element-wise square of a numeric array.
+
+    Raises:
+    - ImportError if NumPy is not installed
+    - TypeError if arr does not have a numeric dtype
+    """
+    _ensure_numpy("square_many")
+    arr = np.asarray(arr)
+    if arr.dtype.kind not in "iufc":
+        raise TypeError("square_many requires a numeric array")
+    return arr * arr
+
+
+def clamp_array(arr: "np.ndarray", low: Number, high: Number) -> "np.ndarray":
+    """
+    Clamp every element of a numeric array to [low, high] with np.clip.
+
+    Raises:
+    - ImportError if NumPy is not installed
+    - TypeError if arr is not numeric or low/high are not numbers
+    - ValueError if low > high
+    """
+    _ensure_numpy("clamp_array")
+    _ensure_number(low, "low")
+    _ensure_number(high, "high")
+    if low > high:
+        raise ValueError("low must be <= high")
+    arr = np.asarray(arr)
+    if arr.dtype.kind not in "iuf":
+        raise TypeError("clamp_array requires a real numeric array")
+    return np.clip(arr, low, high)
 
 
 # Statistics
@@ -225,14 +467,31 @@ def is_prime(n: int) -> bool:
 
 def mean(data: Iterable[Number]) -> float:
     """Return arithmetic mean of data (non-empty)."""
-    seq = _ensure_iterable_numbers(data, "data")
-    return statistics.mean(seq)
+    seq = _ensure_iterable_numbers_np(data, "data")
+    if isinstance(seq, list):
+        return statistics.mean(seq)
+    if seq.dtype.kind in "iu":
+        # Exact like statistics.mean: an int when the mean is integral, else the rounded quotient
+        total = sum(seq.tolist())
+        q, r = divmod(total, seq.size)
+        return total / seq.size if r else q
+    return float(seq.mean())
 
 
 def median(data: Iterable[Number]) -> float:
-    """Return median of data (non-empty)."""
-    seq = _ensure_iterable_numbers(data, "data")
-    return statistics.median(seq)
+    """
+    Return median of data (non-empty).
+
+    NumPy arrays and long int/float inputs use np.partition (O(n) selection) instead of a full sort.
+    """
+    seq = _ensure_iterable_numbers_np(data, "data")
+    if isinstance(seq, list):
+        return statistics.median(seq)
+    k = seq.size // 2
+    if seq.size % 2:
+        return np.partition(seq, k)[k].item()
+    part = np.partition(seq, (k - 1, k))
+    return (part[k - 1].item() + part[k].item()) / 2
 
 
 def mode(data: Iterable[Number]) -> Union[Number, List[Number]]:
@@ -246,12 +505,10 @@ def mode(data: Iterable[Number]) -> Union[Number, List[Number]]:
     try:
         modes = statistics.multimode(seq)
     except AttributeError:
-        # Fallback: compute frequencies manually
-        freq = {}
-        for x in seq:
-            freq[x] = freq.get(x, 0) + 1
-        max_count = max(freq.values())
-        modes = sorted([k for k, v in freq.items() if v == max_count])
+        # Fallback: count frequencies with Counter (C-accelerated)
+        freq = Counter(seq)
+        max_count = freq.most_common(1)[0][1]
+        modes = sorted(k for k, v in freq.items() if v == max_count)
     if not modes:
         raise ValueError("mode: no modes found")
     if len(modes) == 1:
@@ -259,13 +516,49 @@ def mode(data: Iterable[Number]) -> Union[Number, List[Number]]:
     return modes
 
 
+# Inputs at least this long use the single-pass Welford kernel when Numba is available
+_WELFORD_MIN_SIZE = 1_000_000
+
+
+def _welford_m2_py(a):
+    mean = 0.0
+    m2 = 0.0
+    for i in range(a.shape[0]):
+        delta = a[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (a[i] - mean)
+    return m2
+
+
+_welford_m2 = None
+if njit is not None:
+    try:
+        _welford_m2 = njit(cache=True)(_welford_m2_py)
+    except TypeError:
+        # Cython-compiled build: the kernel is not a Python function Numba can JIT
+        pass
+
+
+def _array_variance(arr: "np.ndarray", ddof: int) -> float:
+    """Variance of a 1-D int/float array, matching the statistics module's error for too few points."""
+    if arr.size <= ddof:
+        raise statistics.StatisticsError("variance requires at least two data points")
+    if _welford_m2 is not None and arr.size >= _WELFORD_MIN_SIZE:
+        return float(_welford_m2(arr.astype(np.float64, copy=False)) / (arr.size - ddof))
+    return float(np.var(arr, ddof=ddof))
+
+
 def variance(data: Iterable[Number], *, population: bool = False) -> float:
     """
     Return variance of data.
     - population=False (default) computes sample variance (raises if less than 2 samples)
     - population=True computes population variance
+
+    NumPy arrays and long int/float inputs are reduced with NumPy when it is installed.
     """
-    seq = _ensure_iterable_numbers(data, "data")
+    seq = _ensure_iterable_numbers_np(data, "data")
+    if not isinstance(seq, list):
+        return _array_variance(seq, 0 if population else 1)
     if population:
         return statistics.pvariance(seq)
     return statistics.variance(seq)
@@ -276,8 +569,12 @@ def stddev(data: Iterable[Number], *, population: bool = False) -> float:
     Return standard deviation of data.
     - population=False (default) computes sample stddev
     - population=True computes population stddev
+
+    NumPy arrays and long int/float inputs are reduced with NumPy when it is installed.
     """
-    seq = _ensure_iterable_numbers(data, "data")
+    seq = _ensure_iterable_numbers_np(data, "data")
+    if not isinstance(seq, list):
+        return math.sqrt(_array_variance(seq, 0 if population else 1))
     if population:
         return statistics.pstdev(seq)
     return statistics.stdev(seq)
@@ -294,12 +591,15 @@ def clamp(x: Number, low: Number, high: Number) -> Number:
     - ValueError if low > high
     - TypeError if any argument is not numeric
     """
-    _ensure_number(x, "x")
-    _ensure_number(low, "low")
-    _ensure_number(high, "high")
+    if type(x) not in _NUMTYPES or type(low) not in _NUMTYPES or type(high) not in _NUMTYPES:
+        _ensure_number(x, "x")
+        _ensure_number(low, "low")
+        _ensure_number(high, "high")
     if low > high:
         raise ValueError("low must be <= high")
-    return max(low, min(high, x))
+    # Same result as max(low, min(high, x)) without the two builtin calls
+    m = x if x < high else high
+    return m if m > low else low
 
 
 def approx_equal(a: Number, b: Number, *, rel_tol: float = 1e-9, abs_tol: float = 0.0) -> bool:
@@ -323,11 +623,14 @@ __all__ = [
     "gcd",
     "lcm",
     "is_prime",
+    "is_prime_many",
+    "square_many",
     "mean",
     "median",
     "mode",
     "variance",
     "stddev",
     "clamp",
+    "clamp_array",
     "approx_equal",
 ]
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+setup.py
+
+Build script for math_utils.
+
+When Cython is installed, math_utils.py is compiled in pure-Python mode into a
+C extension that shadows the .py module at import time. The source stays valid
+Python, so the plain module is still installed and used when Cython is missing.
+
+mypyc is deliberately not used as the backend: it turns annotations into strict
+argument checks, so e.g. factorial(3.5) would raise a bare TypeError instead of
+NonIntegerError, and it refuses to build while the numbers.Number annotations
+do not type-check. Cython is run with annotation_typing disabled for the same
+reason.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ["math_utils.py"],
+        compiler_directives={
+            "language_level": 3,
+            # Annotations document the API; they must not coerce arguments.
+            "annotation_typing": False,
+            "boundscheck": False,
+            "wraparound": False,
+        },
+    )
+
+setup(
+    name="math_utils",
+    version="0.1.0",
+    description="A small, robust mathematics utility library",
+    py_modules=["math_utils"],
+    ext_modules=ext_modules,
+    python_requires=">=3.8",
+)
@@ -1,4 +1,5 @@
 import math
+import statistics
 import pytest
 from math_utils import (
     add,
@@ -11,6 +12,9 @@ from math_utils import (
     gcd,
     lcm,
     is_prime,
+    is_prime_many,
+    square_many,
+    clamp_array,
     mean,
     median,
     mode,
@@ -72,10 +76,32 @@ def test_is_prime():
     assert is_prime(2)
     assert is_prime(13)
     assert not is_prime(15)
+    assert is_prime(997)
+    assert is_prime(1_000_000_007)
+    assert not is_prime(3_825_123_056_546_413_051)  # strong pseudoprime to bases 2..23
+    assert not is_prime(318_665_857_834_031_151_167_461)  # strong pseudoprime to bases 2..37
+    assert is_prime(2**61 - 1)
+    assert not is_prime(1_000_000_007 * 998_244_353)
     with pytest.raises(TypeError):
         is_prime(2.5)
 
 
+def test_batch_helpers():
+    np = pytest.importorskip("numpy")
+    ns = np.arange(-3, 200)
+    assert is_prime_many(ns).tolist() == [is_prime(int(n)) for n in ns]
+    assert is_prime_many(np.array([], dtype=np.int64)).size == 0
+    assert square_many(np.array([1, 2, 3])).tolist() == [1, 4, 9]
+    assert square_many([1.5, -2.0]).tolist() == [2.25, 4.0]
+    with pytest.raises(TypeError):
+        is_prime_many(np.array([2.0, 3.0]))
+    with pytest.raises(TypeError):
+        square_many(["a"])
+    assert clamp_array(np.array([-5, 3, 20]), 0, 10).tolist() == [0, 3, 10]
+    with pytest.raises(ValueError):
+        clamp_array(np.array([1.0]), 5, 4)
+
+
 def test_statistics_basic():
     data = [1, 2, 2, 3, 4]
     assert mean(data) == pytest.approx(2.4)
@@ -89,10 +115,63 @@ def test_statistics_basic():
     assert stddev([1, 2, 3, 4]) == pytest.approx(math.sqrt(1.6666666666666667))
 
 
+def test_statistics_long_inputs():
+    data = [x * 0.5 for x in range(5000)]
+    assert variance(data) == pytest.approx(statistics.variance(data))
+    assert variance(data, population=True) == pytest.approx(statistics.pvariance(data))
+    assert stddev(data) == pytest.approx(statistics.stdev(data))
+    assert stddev(data, population=True) == pytest.approx(statistics.pstdev(data))
+    assert median(data) == statistics.median(data)
+    assert median(data[:-1]) == statistics.median(data[:-1])
+
+
+def test_statistics_long_big_ints():
+    data = [2**60 + i for i in range(1024)]
+    assert variance(data) == statistics.variance(data)
+    assert variance(data, population=True) == statistics.pvariance(data)
+    assert stddev(data) == statistics.stdev(data)
+    assert mean(data) == statistics.mean(data)
+    assert median(data) == statistics.median(data)
+
+
+def test_statistics_long_mixed_ints_and_floats():
+    data = [2**60 + i for i in range(1024)] + [0.5]
+    assert median(data) == statistics.median(data) == 1152921504606847487
+    assert mean(data) == statistics.mean(data)
+    assert variance(data) == statistics.variance(data)
+    mixed = [0.0] + list(range(1, 2001))
+    assert median(mixed) == 1000 and type(median(mixed)) is int
+
+
+def test_statistics_long_ints_keep_int_results():
+    assert mean([2] * 2000) == 2 and type(mean([2] * 2000)) is int
+    assert mean([1, 2] * 1000) == 1.5
+    odd = list(range(2001))
+    assert median(odd) == 1000 and type(median(odd)) is int
+    assert median(odd[:-1]) == statistics.median(odd[:-1])
+
+
+def test_statistics_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    arr = np.array([1.0, 2.0, 3.0, 4.0])
+    assert mean(arr) == pytest.approx(2.5)
+    assert median(arr) == 2.5
+    assert median(np.array([5, 1, 3])) == 3
+    assert variance(arr) == pytest.approx(1.6666666666666667)
+    assert stddev(arr, population=True) == pytest.approx(math.sqrt(1.25))
+    with pytest.raises(ValueError):
+        mean(np.array([]))
+    with pytest.raises(ValueError):
+        variance(np.array([1.0]))
+    with pytest.raises(TypeError):
+        mean(["1.5"] * 2000)
+
+
 def test_clamp_and_approx():
     assert clamp(5, 0, 10) == 5
     assert clamp(-1, 0, 10) == 0
     assert clamp(20, 0, 10) == 10
+    assert clamp(2.5, 0, 10) == 2.5
     with pytest.raises(ValueError):
         clamp(1, 5, 4)
     assert approx_equal(1.0000000001, 1.0)
@@ -9,6 +9,13 @@ import logging
 import sys
 from typing import List
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba es opcional
+    njit = None
+
 from config import DEFAULT_DATA, LOG_FORMAT, LOG_LEVEL
 from math_operations import square_number
 
@@ -24,6 +31,20 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Mayor entero cuyo cuadrado cabe en int64 sin desbordar
+_MAX_SAFE_INT = 3037000499
+
+# Tamaño a partir del cual compensa usar el kernel compilado con Numba
+_NUMBA_MIN_SIZE = 1024
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _square_kernel(a, out):
+        for i in range(a.shape[0]):
+            out[i] = a[i] * a[i]
+else:
+    _square_kernel = None
+
 
 def process_numbers(data: List[int | float]) -> List[int | float]:
     """
@@ -53,20 +74,48 @@ def process_numbers(data: List[int | float]) -> List[int | float]:
         logger.warning("La lista de datos está vacía")
         raise ValueError("La lista no puede estar vacía")
 
-    # Validar que todos los elementos sean numéricos
-    for i, value in enumerate(data):
-        if not isinstance(value, (int, float)):
-            logger.error(f"Valor no numérico en índice {i}: {value}")
-            raise ValueError(
-                f"Todos los elementos deben ser números. "
-                f"Valor inválido en índice {i}: {value}"
-            )
+    # Validar el tipo de todos los elementos con una sola comprobación de dtype
+    try:
+        arr = np.asarray(data)
+    except ValueError:
+        arr = None
+    if arr is None or arr.ndim != 1 or arr.dtype.kind not in "iuf":
+        # Camino lento: localizar el primer valor inválido para el mensaje
+        for i, value in enumerate(data):
+            if not isinstance(value, (int, float)):
+                logger.error(f"Valor no numérico en índice {i}: {value}")
+                raise ValueError(
+                    f"Todos los elementos deben ser números. "
+                    f"Valor inválido en índice {i}: {value}"
+                )
+        # Datos válidos sin dtype numérico (bool, enteros grandes): usar Python
+        arr = None
 
     logger.info(f"Procesando {len(data)} números")
-    
-    # List comprehension: más eficiente y pythonic
-    result = [square_number(x) for x in data]
-    
+
+    if arr is not None:
+        if arr.dtype.kind in "iu":
+            # min/max en lugar de np.abs, que desborda con -2**63
+            if arr.min() < -_MAX_SAFE_INT or arr.max() > _MAX_SAFE_INT:
+                arr = None
+        elif not all(isinstance(value, float) for value in data):
+            # Enteros mezclados con floats: NumPy los convertiría a float64 y
+            # perderían su tipo (y exactitud por encima de 2**53)
+            arr = None
+
+    if arr is None:
+        result = [square_number(x) for x in data]
+    elif _square_kernel is not None and len(data) > _NUMBA_MIN_SIZE:
+        # Kernel compilado con Numba; la caché evita recompilar en cada arranque
+        out = np.empty_like(arr)
+        _square_kernel(arr, out)
+        result = out.tolist()
+    else:
+        # Multiplicación vectorizada en NumPy: un solo bucle en C.
+        # Como en Python, un float que desborda da inf sin emitir avisos
+        with np.errstate(over="ignore"):
+            result = np.multiply(arr, arr).tolist()
+
     logger.info(f"Procesamiento completado exitosamente")
     return result
 
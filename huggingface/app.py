@@ -1,24 +1,84 @@
+import os
+from collections import OrderedDict
+
 import gradio as gr
-from transformers import pipeline
+from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from transformers import AutoTokenizer, pipeline
+
+MODEL_ID = "distilbert-base-uncased-finetuned-sst-2-english"
+# Carpeta (junto a este archivo) donde se guarda el modelo ONNX cuantizado a int8
+QUANTIZED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "distilbert-sst2-onnx-int8")
+QUANTIZED_FILE = "model_quantized.onnx"
+# Máximo de resultados guardados en caché
+CACHE_MAX_SIZE = 1024
+# Máximo de solicitudes concurrentes que Gradio agrupa en una sola pasada del modelo
+BATCH_MAX_SIZE = 8
+
+
+def cargar_clasificador():
+    # Exportar a ONNX y cuantizar (int8 dinámico) solo si falta el modelo final;
+    # una carpeta incompleta de una exportación interrumpida se vuelve a generar
+    if not os.path.isfile(os.path.join(QUANTIZED_DIR, QUANTIZED_FILE)):
+        onnx_model = ORTModelForSequenceClassification.from_pretrained(MODEL_ID, export=True)
+        quantizer = ORTQuantizer.from_pretrained(onnx_model)
+        qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=QUANTIZED_DIR, quantization_config=qconfig)
+
+    model = ORTModelForSequenceClassification.from_pretrained(
+        QUANTIZED_DIR,
+        file_name=QUANTIZED_FILE,
+        provider="CPUExecutionProvider",
+    )
+    tokenizer = AutoTokenizer.from_pretrained(MODEL_ID)
+    return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+
+
+# Cargar modelo de sentimiento (ONNX Runtime, int8)
+classifier = cargar_clasificador()
+
+# Caché LRU por texto normalizado: el modelo es "uncased", así que el resultado no cambia
+_cache = OrderedDict()
 
-# Cargar modelo de sentimiento
-classifier = pipeline("sentiment-analysis", model="distilbert-base-uncased-finetuned-sst-2-english")
+def _classify_many(keys):
+    found = {}
+    for key in dict.fromkeys(keys):
+        if key in _cache:
+            _cache.move_to_end(key)
+            found[key] = _cache[key]
+    pendientes = [key for key in dict.fromkeys(keys) if key not in found]
+    if pendientes:
+        # Una sola pasada del modelo para todos los textos que no estaban en caché
+        for key, result in zip(pendientes, classifier(pendientes, batch_size=len(pendientes))):
+            found[key] = result
+            _cache[key] = result
+            if len(_cache) > CACHE_MAX_SIZE:
+                _cache.popitem(last=False)
+    return found
 
-def analyze_sentiment(text):
-    if not text.strip():
-        return "Por favor ingresa un texto."
-    result = classifier(text)[0]
-    label = result["label"]
-    score = round(result["score"], 4)
-    return f"Sentimiento: {label} (confianza: {score})"
+def analyze_sentiment(texts):
+    # Gradio entrega un lote de solicitudes (batch=True) y espera una lista por salida
+    keys = [text.strip().lower() for text in texts]
+    results = _classify_many([key for key in keys if key])
+    outputs = []
+    for key in keys:
+        if not key:
+            outputs.append("Por favor ingresa un texto.")
+            continue
+        label = results[key]["label"]
+        score = round(results[key]["score"], 4)
+        outputs.append(f"Sentimiento: {label} (confianza: {score})")
+    return [outputs]
 
 # Interfaz Gradio
 demo = gr.Interface(
     fn=analyze_sentiment,
     inputs=gr.Textbox(lines=3, label="Texto de entrada"),
     outputs=gr.Textbox(label="Resultado"),
+    batch=True,
+    max_batch_size=BATCH_MAX_SIZE,
     title="Análisis de Sentimiento - ia-prof",
-    description="Modelo de análisis de sentimiento basado en DistilBERT."
+    description="Modelo de análisis de sentimiento basado en DistilBERT (ONNX Runtime, int8)."
 )
 
 demo.launch()
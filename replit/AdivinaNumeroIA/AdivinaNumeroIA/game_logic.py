@@ -3,28 +3,62 @@ Módulo de lógica del juego "Adivina el Número – IA Edition".
 Contiene la lógica principal del juego, generación de números y evaluación de intentos.
 """
 
+import bisect
+import functools
 import random
 
+from game_logic_kernels import _THRESH, _direccion, _pista_idx, _puntaje
+
+# Textos de dirección y de proximidad, indexados por los resultados de los kernels
+_DIRECCIONES = ("Muy bajo", "Muy alto")
+_LABELS = ("¡Muy cerca! 🔥", "Cerca 👍", "Relativamente cerca", "Lejos", "Muy lejos ❄️")
+
+# Las 10 pistas posibles (dirección × proximidad), armadas una sola vez
+_PISTAS = tuple(tuple(f"{d} - {l}" for l in _LABELS) for d in _DIRECCIONES)
+
+# Puntaje mínimo de cada calificación (de menor a mayor)
+_CALIF_TH = (400, 500, 600, 700, 800, 900)
+_CALIF = ("Puedes mejorar 💪", "No está mal 🙂", "Buen trabajo 😊", "¡Bien hecho! 👍",
+          "¡Muy bien! 👏", "¡Excelente! 🌟", "¡EXTRAORDINARIO! 🏆")
+
+# Generador compartido por defecto, enlazado una sola vez al cargar el módulo
+_randrange = random.Random().randrange
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy_y_umbrales():
+    """
+    Importa NumPy y arma el array de umbrales de proximidad una sola vez.
+    Se difiere hasta el primer uso porque el juego interactivo no necesita NumPy.
+    """
+    import numpy as np
+    return np, np.array(_THRESH, dtype=np.int64)
+
 
 class JuegoAdivinaNumero:
     """
     Clase que maneja la lógica del juego de adivinar el número.
     """
     
-    def __init__(self, minimo=1, maximo=100):
+    def __init__(self, minimo=1, maximo=100, rng=None):
         """
         Inicializa un nuevo juego.
         
         Args:
             minimo (int): Número mínimo del rango (por defecto 1)
             maximo (int): Número máximo del rango (por defecto 100)
+            rng (random.Random): Generador opcional, útil para compartir una
+                semilla entre muchas partidas (por defecto, el del módulo)
         """
         self.minimo = minimo
         self.maximo = maximo
+        self._randrange = rng.randrange if rng is not None else _randrange
         self.numero_secreto = self.generar_numero_secreto()
         self.intentos = 0
         self.historial = []
         self.juego_terminado = False
+        self._puntaje_cache = None
+        self._calif_cache = None
     
     def generar_numero_secreto(self):
         """
@@ -33,7 +67,7 @@ class JuegoAdivinaNumero:
         Returns:
             int: Número aleatorio entre minimo y maximo (inclusive)
         """
-        return random.randint(self.minimo, self.maximo)
+        return self._randrange(self.minimo, self.maximo + 1)
     
     def evaluar_intento(self, numero):
         """
@@ -50,6 +84,8 @@ class JuegoAdivinaNumero:
         """
         self.intentos += 1
         self.historial.append(numero)
+        self._puntaje_cache = None
+        self._calif_cache = None
         
         diferencia = abs(numero - self.numero_secreto)
         
@@ -70,6 +106,45 @@ class JuegoAdivinaNumero:
             'diferencia': diferencia
         }
     
+    def evaluar_intentos_batch(self, intentos):
+        """
+        Evalúa muchos intentos a la vez con NumPy, para simulaciones o análisis.
+        A diferencia de evaluar_intento, no modifica el estado del juego.
+        
+        Args:
+            intentos (array-like de int): Los números a evaluar
+        
+        Returns:
+            dict: Diccionario de arrays de NumPy, uno por campo:
+                - 'diff': diferencia absoluta con el número secreto
+                - 'dir': 1 si el intento es mayor que el secreto, 0 si no
+                - 'pista_idx': tramo de proximidad (índice en _LABELS)
+                - 'correcto': bool, si el intento es el número secreto
+        
+        Raises:
+            ImportError: Si NumPy no está instalado
+            TypeError: Si los intentos no son números enteros
+        """
+        try:
+            np, umbrales = _numpy_y_umbrales()
+        except ImportError:
+            raise ImportError("evaluar_intentos_batch requiere NumPy (pip install numpy)") from None
+        
+        intentos = np.asarray(intentos)
+        # Convertir a int64 truncaría en silencio intentos como 1.7
+        if intentos.size and intentos.dtype.kind not in "iu":
+            raise TypeError(f"Los intentos deben ser números enteros (dtype recibido: {intentos.dtype})")
+        intentos = intentos.astype(np.int64, copy=False)
+        diff = np.abs(intentos - self.numero_secreto)
+        
+        return {
+            'diff': diff,
+            'dir': (intentos > self.numero_secreto).astype(np.int8),
+            # side='left' equivale a "diferencia <= umbral", igual que _pista_idx
+            'pista_idx': np.searchsorted(umbrales, diff),
+            'correcto': diff == 0
+        }
+    
     def generar_pista(self, numero, diferencia):
         """
         Genera una pista basada en la diferencia entre el número y el secreto.
@@ -81,25 +156,8 @@ class JuegoAdivinaNumero:
         Returns:
             str: La pista generada
         """
-        # Determinar si es muy alto o muy bajo
-        direccion = "Muy alto" if numero > self.numero_secreto else "Muy bajo"
-        
-        # Determinar si está cerca o lejos (±10 se considera "cerca")
-        proximidad = "Cerca" if diferencia <= 10 else "Lejos"
-        
-        # Pistas extra para mejorar la experiencia
-        if diferencia <= 3:
-            proximidad = "¡Muy cerca! 🔥"
-        elif diferencia <= 5:
-            proximidad = "Cerca 👍"
-        elif diferencia <= 10:
-            proximidad = "Relativamente cerca"
-        elif diferencia <= 20:
-            proximidad = "Lejos"
-        else:
-            proximidad = "Muy lejos ❄️"
-        
-        return f"{direccion} - {proximidad}"
+        # Dirección (muy bajo/muy alto) y tramo de proximidad (≤3, ≤5, ≤10, ≤20, >20)
+        return _PISTAS[_direccion(numero, self.numero_secreto)][_pista_idx(diferencia)]
     
     def calcular_puntaje(self):
         """
@@ -112,25 +170,13 @@ class JuegoAdivinaNumero:
         if not self.juego_terminado:
             return 0
         
+        # El puntaje no cambia hasta el siguiente intento o reinicio
+        if self._puntaje_cache is not None:
+            return self._puntaje_cache
+        
         # Puntaje base de 1000, se reduce según intentos
-        if self.intentos == 1:
-            return 1000  # Puntaje perfecto
-        elif self.intentos <= 3:
-            return 900
-        elif self.intentos <= 5:
-            return 800
-        elif self.intentos <= 7:
-            return 700
-        elif self.intentos <= 10:
-            return 600
-        elif self.intentos <= 15:
-            return 500
-        elif self.intentos <= 20:
-            return 400
-        else:
-            # A partir de 20 intentos, se va reduciendo gradualmente
-            puntaje = max(100, 400 - (self.intentos - 20) * 10)
-            return puntaje
+        self._puntaje_cache = _puntaje(self.intentos)
+        return self._puntaje_cache
     
     def obtener_calificacion(self):
         """
@@ -139,22 +185,12 @@ class JuegoAdivinaNumero:
         Returns:
             str: Calificación del desempeño
         """
-        puntaje = self.calcular_puntaje()
-        
-        if puntaje >= 900:
-            return "¡EXTRAORDINARIO! 🏆"
-        elif puntaje >= 800:
-            return "¡Excelente! 🌟"
-        elif puntaje >= 700:
-            return "¡Muy bien! 👏"
-        elif puntaje >= 600:
-            return "¡Bien hecho! 👍"
-        elif puntaje >= 500:
-            return "Buen trabajo 😊"
-        elif puntaje >= 400:
-            return "No está mal 🙂"
-        else:
-            return "Puedes mejorar 💪"
+        if self._calif_cache is not None:
+            return self._calif_cache
+        
+        # bisect_right: un puntaje igual al umbral pertenece al tramo superior
+        self._calif_cache = _CALIF[bisect.bisect_right(_CALIF_TH, self.calcular_puntaje())]
+        return self._calif_cache
     
     def obtener_estadisticas(self):
         """
@@ -167,7 +203,7 @@ class JuegoAdivinaNumero:
             'intentos': self.intentos,
             'puntaje': self.calcular_puntaje(),
             'calificacion': self.obtener_calificacion(),
-            'historial': self.historial.copy(),
+            'historial': tuple(self.historial),
             'numero_secreto': self.numero_secreto if self.juego_terminado else None
         }
     
@@ -179,3 +215,5 @@ class JuegoAdivinaNumero:
         self.intentos = 0
         self.historial = []
         self.juego_terminado = False
+        self._puntaje_cache = None
+        self._calif_cache = None
@@ -0,0 +1,92 @@
+"""
+Módulo de kernels numéricos para el juego "Adivina el Número – IA Edition".
+Contiene las partes puramente enteras de la lógica del juego (puntaje, tramo de
+proximidad y dirección de la pista), pensadas para simulaciones masivas.
+
+Por defecto son funciones normales de Python basadas en bisect, así que el
+juego interactivo no carga Numba. Con la variable de entorno ADIVINA_NUMBA=1 y
+Numba instalado, se compilan versiones equivalentes con @njit (cache=True guarda
+el código compilado entre ejecuciones).
+"""
+
+import os
+from bisect import bisect_left
+
+# Umbrales de diferencia (inclusive) de cada tramo de proximidad
+_THRESH = (3, 5, 10, 20)
+
+# Umbrales de intentos (inclusive) y puntaje de cada tramo; más de 20 usa la fórmula gradual
+_INTENTOS_TH = (1, 3, 5, 7, 10, 15, 20)
+_PUNTAJES = (1000, 900, 800, 700, 600, 500, 400)
+
+NUMBA_DISPONIBLE = False
+if os.environ.get("ADIVINA_NUMBA") == "1":
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+    else:
+        NUMBA_DISPONIBLE = True
+
+
+def _puntaje(intentos):
+    """
+    Calcula el puntaje de una partida terminada en el número de intentos dado.
+
+    Args:
+        intentos (int): Intentos realizados (1 o más)
+
+    Returns:
+        int: El puntaje obtenido (100-1000)
+    """
+    idx = bisect_left(_INTENTOS_TH, intentos)
+    if idx < len(_PUNTAJES):
+        return _PUNTAJES[idx]
+    # A partir de 20 intentos, se va reduciendo gradualmente
+    return max(100, 400 - (intentos - 20) * 10)
+
+
+def _pista_idx(diferencia):
+    """
+    Obtiene el tramo de proximidad para una diferencia (≤3, ≤5, ≤10, ≤20, >20).
+
+    Args:
+        diferencia (int): Diferencia absoluta con el número secreto
+
+    Returns:
+        int: Índice del tramo, de 0 (muy cerca) a 4 (muy lejos)
+    """
+    return bisect_left(_THRESH, diferencia)
+
+
+def _direccion(numero, secreto):
+    """
+    Indica la dirección de la pista.
+
+    Args:
+        numero (int): El número adivinado
+        secreto (int): El número secreto
+
+    Returns:
+        int: 1 si el número es mayor que el secreto ("Muy alto"), 0 si no ("Muy bajo")
+    """
+    return 1 if numero > secreto else 0
+
+
+if NUMBA_DISPONIBLE:
+    # bisect no existe en modo nopython: se compilan versiones equivalentes con bucles
+    @njit("int64(int64)", cache=True)
+    def _puntaje(intentos):
+        for i in range(len(_INTENTOS_TH)):
+            if intentos <= _INTENTOS_TH[i]:
+                return _PUNTAJES[i]
+        return max(100, 400 - (intentos - 20) * 10)
+
+    @njit("int64(int64)", cache=True)
+    def _pista_idx(diferencia):
+        for i in range(len(_THRESH)):
+            if diferencia <= _THRESH[i]:
+                return i
+        return len(_THRESH)
+
+    _direccion = njit("int64(int64, int64)", cache=True)(_direccion)
@@ -7,30 +7,59 @@ Autor: Replit Agent
 Fecha: 2025
 """
 
+import sys
+
 from game_logic import JuegoAdivinaNumero
 from utils import obtener_numero_usuario, confirmar_accion, limpiar_pantalla
 
 
+# Textos fijos armados una sola vez al importar y escritos con una sola llamada
+_SEPARADOR = "=" * 60
+
+_BIENVENIDA = "\n".join([
+    _SEPARADOR,
+    " " * 15 + "🎮 ADIVINA EL NÚMERO – IA EDITION 🎮",
+    _SEPARADOR,
+    "",
+    "📋 INSTRUCCIONES:",
+    "   • Adivina el número secreto entre 1 y 100",
+    "   • Recibirás pistas después de cada intento",
+    "   • Menos intentos = Mayor puntaje",
+    "",
+    "💡 PISTAS:",
+    "   • 'Muy alto' o 'Muy bajo': dirección del número",
+    "   • 'Cerca' (±10): estás cerca del número",
+    "   • 'Lejos': estás lejos del número",
+    "",
+    _SEPARADOR,
+    "",
+]) + "\n"
+
+_DESPEDIDA = "\n".join([
+    "",
+    _SEPARADOR,
+    " " * 15 + "👋 ¡Gracias por jugar!",
+    " " * 10 + "Creado con ❤️  por Replit Agent",
+    _SEPARADOR,
+    "",
+]) + "\n"
+
+_ESTADISTICAS_INICIO = "\n".join([
+    "",
+    _SEPARADOR,
+    " " * 20 + "📊 ESTADÍSTICAS FINALES",
+    _SEPARADOR,
+    "",
+])
+
+_ESTADISTICAS_FIN = _SEPARADOR + "\n\n"
+
+
 def mostrar_bienvenida():
     """
     Muestra el mensaje de bienvenida y las instrucciones del juego.
     """
-    print("=" * 60)
-    print(" " * 15 + "🎮 ADIVINA EL NÚMERO – IA EDITION 🎮")
-    print("=" * 60)
-    print()
-    print("📋 INSTRUCCIONES:")
-    print("   • Adivina el número secreto entre 1 y 100")
-    print("   • Recibirás pistas después de cada intento")
-    print("   • Menos intentos = Mayor puntaje")
-    print()
-    print("💡 PISTAS:")
-    print("   • 'Muy alto' o 'Muy bajo': dirección del número")
-    print("   • 'Cerca' (±10): estás cerca del número")
-    print("   • 'Lejos': estás lejos del número")
-    print()
-    print("=" * 60)
-    print()
+    sys.stdout.write(_BIENVENIDA)
 
 
 def mostrar_resultado_intento(resultado, intento_num):
@@ -59,24 +88,23 @@ def mostrar_estadisticas_finales(juego):
     Args:
         juego (JuegoAdivinaNumero): Instancia del juego
     """
-    stats = juego.obtener_estadisticas()
+    # Se leen los datos directamente del juego, sin armar el dict de obtener_estadisticas
+    numero_secreto = juego.numero_secreto if juego.juego_terminado else None
+    puntaje = juego.calcular_puntaje()
     
-    print()
-    print("=" * 60)
-    print(" " * 20 + "📊 ESTADÍSTICAS FINALES")
-    print("=" * 60)
-    print(f"🎯 Número secreto: {stats['numero_secreto']}")
-    print(f"🔢 Intentos realizados: {stats['intentos']}")
-    print(f"⭐ Puntaje obtenido: {stats['puntaje']} / 1000")
-    print(f"🏅 Calificación: {stats['calificacion']}")
-    print()
+    partes = [
+        _ESTADISTICAS_INICIO,
+        f"🎯 Número secreto: {numero_secreto}\n"
+        f"🔢 Intentos realizados: {juego.intentos}\n"
+        f"⭐ Puntaje obtenido: {puntaje} / 1000\n"
+        f"🏅 Calificación: {juego.obtener_calificacion()}\n\n",
+    ]
     
-    if len(stats['historial']) > 1:
-        print(f"📝 Historial de intentos: {', '.join(map(str, stats['historial']))}")
-        print()
+    if juego.intentos > 1:
+        partes.append(f"📝 Historial de intentos: {', '.join(map(str, juego.historial))}\n\n")
     
-    print("=" * 60)
-    print()
+    partes.append(_ESTADISTICAS_FIN)
+    sys.stdout.write("".join(partes))
 
 
 def jugar_partida():
@@ -141,12 +169,7 @@ def main():
             print("🎮 ¡Nueva partida!\n")
     
     # Mensaje de despedida
-    print()
-    print("=" * 60)
-    print(" " * 15 + "👋 ¡Gracias por jugar!")
-    print(" " * 10 + "Creado con ❤️  por Replit Agent")
-    print("=" * 60)
-    print()
+    sys.stdout.write(_DESPEDIDA)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,20 @@ Módulo de utilidades para el juego "Adivina el Número".
 Contiene funciones de validación de entrada del usuario.
 """
 
+import os
+import sys
+
+# Secuencia ANSI: borrar pantalla y mover el cursor al inicio
+_LIMPIAR_ANSI = "\x1b[2J\x1b[H"
+
+# En Windows, una llamada vacía a os.system activa el procesamiento de secuencias ANSI
+if os.name == "nt":
+    os.system("")
+
+# Respuestas aceptadas por confirmar_accion
+_YES = frozenset(("s", "si", "sí", "yes", "y"))
+_NO = frozenset(("n", "no"))
+
 def validar_numero(entrada, minimo=1, maximo=100):
     """
     Valida que la entrada del usuario sea un número entero dentro del rango especificado.
@@ -48,15 +62,22 @@ def obtener_numero_usuario(mensaje, minimo=1, maximo=100):
     
     Returns:
         int: El número válido ingresado por el usuario
+    
+    Nota:
+        Aplica las mismas reglas que validar_numero, pero directamente en el
+        bucle para no construir la tupla de resultado en cada entrada.
     """
     while True:
         entrada = input(mensaje)
-        valido, numero, error = validar_numero(entrada, minimo, maximo)
+        try:
+            numero = int(entrada)
+        except ValueError:
+            print("❌ Por favor, ingresa un número válido.")
+            continue
         
-        if valido:
+        if minimo <= numero <= maximo:
             return numero
-        else:
-            print(f"❌ {error}")
+        print(f"❌ El número debe estar entre {minimo} y {maximo}.")
 
 
 def confirmar_accion(mensaje):
@@ -72,9 +93,9 @@ def confirmar_accion(mensaje):
     while True:
         respuesta = input(f"{mensaje} (s/n): ").strip().lower()
         
-        if respuesta in ['s', 'si', 'sí', 'yes', 'y']:
+        if respuesta in _YES:
             return True
-        elif respuesta in ['n', 'no']:
+        elif respuesta in _NO:
             return False
         else:
             print("Por favor, responde 's' para sí o 'n' para no.")
@@ -82,7 +103,12 @@ def confirmar_accion(mensaje):
 
 def limpiar_pantalla():
     """
-    Imprime líneas en blanco para simular limpieza de pantalla.
-    Compatible con todos los sistemas operativos.
+    Limpia la pantalla con una única escritura de la secuencia ANSI.
+    Si la salida no es una terminal (por ejemplo, redirigida a un archivo),
+    imprime líneas en blanco como antes.
     """
-    print("\n" * 50)
+    if sys.stdout.isatty():
+        sys.stdout.write(_LIMPIAR_ANSI)
+        sys.stdout.flush()
+    else:
+        print("\n" * 50)